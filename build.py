@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import py_compile
+import shutil
+import tempfile
+import zipapp
+from pathlib import Path
+
+
+REPOSITORY_DIRECTORY: Path = Path(__file__).resolve().parent
+INSTALLER_SOURCE_PATH: Path = REPOSITORY_DIRECTORY / "installer.py"
+INSTALLER_ARCHIVE_PATH: Path = REPOSITORY_DIRECTORY / "installer.pyz"
+ARCHIVE_INTERPRETER: str = "/usr/bin/env python3"
+ARCHIVE_ENTRY_POINT: str = "installer:main"
+
+
+def buildInstallerArchive() -> Path:
+    with tempfile.TemporaryDirectory() as stagingDirectoryName:
+        stagingDirectory: Path = Path(stagingDirectoryName)
+        stagedSourcePath: Path = stagingDirectory / INSTALLER_SOURCE_PATH.name
+        shutil.copy2(INSTALLER_SOURCE_PATH, stagedSourcePath)
+        py_compile.compile(str(stagedSourcePath), cfile=str(stagedSourcePath.with_suffix(".pyc")), doraise=True)
+
+        zipapp.create_archive(stagingDirectory, target=INSTALLER_ARCHIVE_PATH, interpreter=ARCHIVE_INTERPRETER, main=ARCHIVE_ENTRY_POINT)
+
+    return INSTALLER_ARCHIVE_PATH
+
+
+def main() -> None:
+    archivePath: Path = buildInstallerArchive()
+    print(f"Built installer archive: {archivePath}")
+    print("Run it with:")
+    print(f"  python {archivePath.name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,18 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import http.client
 import os
-import stat
+import shutil
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
+import urllib.error
 import urllib.request
 
 
@@ -16,8 +21,37 @@ RAW_MAIN_URL: str = ("https://raw.githubusercontent.com/Alex-2504834/RandomStude
 RAW_ICON_URL: str = ("https://raw.githubusercontent.com/Alex-2504834/RandomStudentPicker/main/assets/sys/icon.ico")
 
 REQUIREMENTS_CONTENT: str = """
-customtkinter>=5.2,<6
-pywin32>=306; platform_system == "Windows"
+customtkinter==5.2.2 \\
+    --hash=sha256:14ad3e7cd3cb3b9eb642b9d4e8711ae80d3f79fb82545ad11258eeffb2e6b37c \\
+    --hash=sha256:fd8db3bafa961c982ee6030dba80b4c2e25858630756b513986db19113d8d207
+darkdetect==0.8.0 \\
+    --hash=sha256:a7509ccf517eaad92b31c214f593dbcf138ea8a43b2935406bbd565e15527a85 \\
+    --hash=sha256:b5428e1170263eb5dea44c25dc3895edd75e6f52300986353cd63533fe7df8b1
+packaging==25.0 \\
+    --hash=sha256:29572ef2b1f17581046b3a2227d5c611fb25ec70ca1ba8554b24b0e69331a484 \\
+    --hash=sha256:d443872c98d677bf60f6a1f2f8c1cb748e8fe762d2bf9d3148b5599295b0fc4f
+"""
+
+WINDOWS_SHORTCUT_REQUIREMENTS_CONTENT: str = """
+pywin32==311 \\
+    --hash=sha256:0502d1facf1fed4839a9a51ccbcc63d952cf318f78ffc00a7e78528ac27d7a2b \\
+    --hash=sha256:184eb5e436dea364dcd3d2316d577d625c0351bf237c4e9a5fabbcfa5a58b151 \\
+    --hash=sha256:3aca44c046bd2ed8c90de9cb8427f581c479e594e99b5c0bb19b29c10fd6cb87 \\
+    --hash=sha256:3ce80b34b22b17ccbd937a6e78e7225d80c52f5ab9940fe0506a1a16f3dab503 \\
+    --hash=sha256:62ea666235135fee79bb154e695f3ff67370afefd71bd7fea7512fc70ef31e3d \\
+    --hash=sha256:718a38f7e5b058e76aee1c56ddd06908116d35147e133427e59a3983f703a20d \\
+    --hash=sha256:750ec6e621af2b948540032557b10a2d43b0cee2ae9758c54154d711cc852d31 \\
+    --hash=sha256:797c2772017851984b97180b0bebe4b620bb86328e8a884bb626156295a63b3b \\
+    --hash=sha256:7b4075d959648406202d92a2310cb990fea19b535c7f4a78d3f5e10b926eeb8a \\
+    --hash=sha256:a508e2d9025764a8270f93111a970e1d0fbfc33f4153b388bb649b7eec4f9b42 \\
+    --hash=sha256:a733f1388e1a842abb67ffa8e7aad0e70ac519e09b0f6a784e65a136ec7cefd2 \\
+    --hash=sha256:aba8f82d551a942cb20d4a83413ccbac30790b50efb89a75e4f586ac0bb8056b \\
+    --hash=sha256:b7a2c10b93f8986666d0c803ee19b5990885872a7de910fc460f9b0c2fbf92ee \\
+    --hash=sha256:b8c095edad5c211ff31c05223658e71bf7116daa0ecf3ad85f3201ea3190d067 \\
+    --hash=sha256:d03ff496d2a0cd4a5893504789d4a15399133fe82517455e78bad62efbb7f0a3 \\
+    --hash=sha256:e0c4cfb0621281fe40387df582097fd796e80430597cb9944f0ae70447bacd91 \\
+    --hash=sha256:e286f46a9a39c4a18b319c28f59b61de793654af2f395c102b4f819e584b5852 \\
+    --hash=sha256:f95ba5a847cba10dd8c4d8fefa9f2a6cf283b8b88ed6178fa8a6c1ab16054d0d
 """
 
 APP_NAME: str = "Random Student Picker"
@@ -25,34 +59,139 @@ APP_FOLDER_NAME: str = "randomStudentPicker"
 MAIN_FILE_NAME: str = "main.py"
 ICON_FILE_NAME: str = "icon.ico"
 
-def downloadFile(url: str, destinationPath: Path) -> bool:
+DESKTOP_ENTRY_TEMPLATE: str = (
+    "[Desktop Entry]\n"
+    "Type=Application\n"
+    "Name={name}\n"
+    'Exec="{executable}" "{mainPyPath}"\n'
+    "Terminal=false\n"
+    "{iconLine}"
+    "Categories=Education;\n"
+)
+
+PLATFORM_NAME: str = "win" if sys.platform.startswith("win") else "mac" if sys.platform.startswith("darwin") else "linux"
+
+DOWNLOAD_CHUNK_SIZE: int = 262144
+DOWNLOAD_TIMEOUT_SECONDS: float = 60.0
+DOWNLOAD_ATTEMPTS: int = 3
+DOWNLOAD_RETRY_DELAY_SECONDS: float = 0.5
+RETRYABLE_HTTP_STATUS_CODES: Tuple[int, ...] = (429, 500, 502, 503, 504)
+
+
+def getEtagPath(destinationPath: Path) -> Path:
+    return destinationPath.with_suffix(destinationPath.suffix + ".etag")
+
+def downloadFile(url: str, destinationPath: Path, force: bool = False) -> bool:
     print(f"Downloading: {url}")
+    etagPath: Path = getEtagPath(destinationPath)
+    partialPath: Path = destinationPath.with_suffix(destinationPath.suffix + ".part")
+    requestHeaders: Dict[str, str] = {}
+    if not force and destinationPath.exists() and etagPath.exists():
+        requestHeaders["If-None-Match"] = etagPath.read_text(encoding="utf-8").strip()
+
+    lastError: Optional[Exception] = None
+    for attempt in range(DOWNLOAD_ATTEMPTS):
+        if attempt > 0:
+            time.sleep(DOWNLOAD_RETRY_DELAY_SECONDS * (2 ** (attempt - 1)))
+            print(f"Retrying {url} (attempt {attempt + 1} of {DOWNLOAD_ATTEMPTS})...")
+
+        try:
+            request: urllib.request.Request = urllib.request.Request(url, headers=requestHeaders)
+            with urllib.request.urlopen(request, timeout=DOWNLOAD_TIMEOUT_SECONDS) as response, partialPath.open("wb") as destinationFile:
+                shutil.copyfileobj(response, destinationFile, DOWNLOAD_CHUNK_SIZE)
+                bytesWritten: int = destinationFile.tell()
+                etag: str = response.headers.get("ETag", "")
+                contentLength: Optional[str] = response.headers.get("Content-Length")
+
+            if contentLength is not None and contentLength.isdigit() and int(contentLength) != bytesWritten:
+                raise ConnectionError(f"received {bytesWritten} of {contentLength} bytes")
+
+            os.replace(partialPath, destinationPath)
+
+            if etag:
+                etagPath.write_text(etag, encoding="utf-8")
+            else:
+                etagPath.unlink(missing_ok=True)
+
+            print(f"Saved to: {destinationPath}")
+            return True
+        except urllib.error.HTTPError as error:
+            if error.code == 304:
+                print(f"Already up to date: {destinationPath}")
+                return True
+            lastError = error
+            if error.code not in RETRYABLE_HTTP_STATUS_CODES:
+                break
+        except (OSError, http.client.HTTPException) as error:
+            lastError = error
+        except Exception as error:
+            lastError = error
+            break
+        finally:
+            partialPath.unlink(missing_ok=True)
+
+    print(f"Failed to download {url}: {lastError}")
+    etagPath.unlink(missing_ok=True)
+    return False
+
+def downloadMany(jobs: List[Tuple[str, Path]], force: bool = False) -> Dict[str, bool]:
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        results: List[bool] = list(executor.map(lambda job: downloadFile(*job, force=force), jobs))
+    return {url: result for (url, _), result in zip(jobs, results)}
+
+def writeFile(path: Path, content: str, executable: bool = False) -> None:
+    data: bytes = content.encode("utf-8")
+    fileMode: int = 0o755 if executable else 0o644
+    fileDescriptor: int = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), fileMode)
     try:
-        urllib.request.urlretrieve(url, destinationPath)
-        print(f"Saved to: {destinationPath}")
-        return True
-    except Exception as error:
-        print(f"Failed to download {url}: {error}")
-        return False
-
-def writeFile(path: Path, content: str) -> None:
-    path.write_text(content, encoding="utf-8")
+        if executable and hasattr(os, "fchmod"):
+            os.fchmod(fileDescriptor, fileMode)
+        view: memoryview = memoryview(data)
+        while view:
+            view = view[os.write(fileDescriptor, view):]
+    finally:
+        os.close(fileDescriptor)
     print(f"Wrote file: {path}")
 
-def pipInstallRequirements(requirementsFile: Path) -> None:
+def getPipInstallArguments(requirementsFile: Path, cacheDirectory: Optional[Path] = None, strictWheels: bool = False) -> List[str]:
+    uvExecutable: Optional[str] = shutil.which("uv") if sys.prefix != sys.base_prefix else None
+    if uvExecutable:
+        pipArguments: List[str] = [uvExecutable, "pip", "install", "--python", sys.executable, "--no-deps", "--require-hashes"]
+        if strictWheels:
+            pipArguments += ["--only-binary", ":all:"]
+    else:
+        pipArguments = [sys.executable, "-m", "pip", "install", "--disable-pip-version-check", "--prefer-binary", "--no-input", "--no-deps", "--require-hashes"]
+        if strictWheels:
+            pipArguments.append("--only-binary=:all:")
+    if cacheDirectory is not None:
+        pipArguments += ["--cache-dir", str(cacheDirectory)]
+    pipArguments += ["-r", str(requirementsFile)]
+    return pipArguments
+
+def pipInstallRequirements(requirementsFile: Path, cacheDirectory: Optional[Path] = None, strictWheels: bool = False) -> subprocess.Popen:
     print("\nInstalling Python dependencies...\n")
-    try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", str(requirementsFile)])
+    pipArguments: List[str] = getPipInstallArguments(requirementsFile, cacheDirectory, strictWheels)
+
+    pipEnvironment: Dict[str, str] = dict(os.environ, PIP_DISABLE_PIP_VERSION_CHECK="1")
+
+    return subprocess.Popen(pipArguments, env=pipEnvironment)
+
+def waitForPipInstall(pipProcess: subprocess.Popen, requirementsFile: Path) -> bool:
+    returnCode: int = pipProcess.wait()
+    if returnCode == 0:
         print("\nDependencies installed successfully.\n")
-    except subprocess.CalledProcessError as error:
-        print(f"Failed to install dependencies: {error}")
-        print("You may need to run pip manually:")
-        print(f"  {sys.executable} -m pip install -r {requirementsFile}")
+        return True
 
+    print(f"Failed to install dependencies: pip exited with status {returnCode}")
+    print("You may need to run pip manually:")
+    print(f"  {sys.executable} -m pip install --no-deps --require-hashes -r {requirementsFile}")
+    return False
 
+
+@lru_cache(maxsize=1)
 def getDesktopDirectory() -> Path:
     homeDirectory: Path = Path.home()
-    if sys.platform.startswith("win"):
+    if PLATFORM_NAME == "win":
         userProfile: str = os.environ.get("USERPROFILE", str(homeDirectory))
         desktopDirectory: Path = Path(userProfile) / "Desktop"
     else:
@@ -60,14 +199,19 @@ def getDesktopDirectory() -> Path:
     return desktopDirectory
 
 
+@lru_cache(maxsize=1)
+def getWScriptShell():
+    import win32com.client
+    return win32com.client.Dispatch("WScript.Shell")
+
+
 def createWindowsShortcutLnk(shortcutPath: Path, targetScript: Path, workingDirectory: Path, iconPath: Optional[Path]) -> None:
     try:
-        import win32com.client
+        shell = getWScriptShell()
     except ImportError:
         print("pywin32 is not installed; cannot create .lnk shortcut.")
         return
 
-    shell = win32com.client.Dispatch("WScript.Shell")
     shortcut = shell.CreateShortCut(str(shortcutPath))
 
     shortcut.TargetPath = str(sys.executable)
@@ -80,79 +224,82 @@ def createWindowsShortcutLnk(shortcutPath: Path, targetScript: Path, workingDire
     shortcut.Save()
     print(f"Created Windows shortcut: {shortcutPath}")
 
-def createDesktopShortcut(mainPyPath: Path, appDirectory: Path, iconPath: Optional[Path]) -> None:
-    desktopDirectory: Path = getDesktopDirectory()
-    desktopDirectory.mkdir(parents=True, exist_ok=True)
-
-    if sys.platform.startswith("win"):
-        shortcutPath: Path = desktopDirectory / f"{APP_NAME}.lnk"
-        createWindowsShortcutLnk(shortcutPath, mainPyPath, appDirectory, iconPath)
-
-    elif sys.platform.startswith("darwin"):
-        shortcutPath = desktopDirectory / "RandomStudentPicker.command"
-        scriptContent: str = (
-            f'#!/bin/bash\n'
-            f'cd "{appDirectory}"\n'
-            f'"{sys.executable}" "{mainPyPath.name}"\n'
-        )
-        writeFile(shortcutPath, scriptContent)
-        shortcutPath.chmod(shortcutPath.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH )
-        print(f"Created macOS launcher: {shortcutPath}")
+def writeDesktopEntry(shortcutPath: Path, mainPyPath: Path, iconPath: Optional[Path]) -> None:
+    iconLine: str = f"Icon={iconPath}\n" if iconPath and iconPath.exists() else ""
+    desktopEntry: str = DESKTOP_ENTRY_TEMPLATE.format(name=APP_NAME, executable=sys.executable, mainPyPath=mainPyPath, iconLine=iconLine)
+    writeFile(shortcutPath, desktopEntry, executable=True)
 
-    else:
-        shortcutPath = desktopDirectory / "RandomStudentPicker.desktop"
-        iconLine: str = f"Icon={iconPath}\n" if iconPath and iconPath.exists() else ""
-        desktopEntry: str = (
-            "[Desktop Entry]\n"
-            "Type=Application\n"
-            f"Name={APP_NAME}\n"
-            f'Exec="{sys.executable}" "{mainPyPath}"\n'
-            "Terminal=false\n"
-            f"{iconLine}"
-            "Categories=Education;\n"
-        )
-        writeFile(shortcutPath, desktopEntry)
-        shortcutPath.chmod(shortcutPath.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-        print(f"Created Linux .desktop launcher: {shortcutPath}")
 
+def createWindowsDesktopShortcut(mainPyPath: Path, appDirectory: Path, iconPath: Optional[Path]) -> None:
+    shortcutPath: Path = getDesktopDirectory() / f"{APP_NAME}.lnk"
+    createWindowsShortcutLnk(shortcutPath, mainPyPath, appDirectory, iconPath)
+
+
+def createMacDesktopShortcut(mainPyPath: Path, appDirectory: Path, iconPath: Optional[Path]) -> None:
+    shortcutPath: Path = getDesktopDirectory() / "RandomStudentPicker.command"
+    scriptContent: str = (
+        f'#!/bin/bash\n'
+        f'cd "{appDirectory}"\n'
+        f'"{sys.executable}" "{mainPyPath.name}"\n'
+    )
+    writeFile(shortcutPath, scriptContent, executable=True)
+    print(f"Created macOS launcher: {shortcutPath}")
 
-def createStartMenuEntry(mainPyPath: Path, appDirectory: Path, iconPath: Optional[Path]) -> None:
-    if sys.platform.startswith("win"):
-        appData: Optional[str] = os.environ.get("APPDATA")
-        if not appData:
-            print("Could not locate APPDATA; skipping Start Menu entry.")
-            return
 
-        startMenuDirectory: Path = (Path(appData) / "Microsoft" / "Windows" / "Start Menu" / "Programs")
-        startMenuDirectory.mkdir(parents=True, exist_ok=True)
+def createLinuxDesktopShortcut(mainPyPath: Path, appDirectory: Path, iconPath: Optional[Path]) -> None:
+    shortcutPath: Path = getDesktopDirectory() / "RandomStudentPicker.desktop"
+    writeDesktopEntry(shortcutPath, mainPyPath, iconPath)
+    print(f"Created Linux .desktop launcher: {shortcutPath}")
 
-        shortcutPath: Path = startMenuDirectory / f"{APP_NAME}.lnk"
-        createWindowsShortcutLnk(shortcutPath, mainPyPath, appDirectory, iconPath)
 
-    elif sys.platform.startswith("darwin"):
-        print("macOS does not have a simple Start Menu equivalent. Skipping.")
+def createWindowsStartMenuEntry(mainPyPath: Path, appDirectory: Path, iconPath: Optional[Path]) -> None:
+    appData: Optional[str] = os.environ.get("APPDATA")
+    if not appData:
+        print("Could not locate APPDATA; skipping Start Menu entry.")
         return
 
-    else:
-        applicationsDirectory: Path = Path.home() / ".local" / "share" / "applications"
-        applicationsDirectory.mkdir(parents=True, exist_ok=True)
-
-        shortcutPath = applicationsDirectory / "random-student-picker.desktop"
-        iconLine: str = f"Icon={iconPath}\n" if iconPath and iconPath.exists() else ""
-        desktopEntry: str = (
-            "[Desktop Entry]\n"
-            "Type=Application\n"
-            f"Name={APP_NAME}\n"
-            f'Exec="{sys.executable}" "{mainPyPath}"\n'
-            "Terminal=false\n"
-            f"{iconLine}"
-            "Categories=Education;\n"
-        )
-        writeFile(shortcutPath, desktopEntry)
-        shortcutPath.chmod(shortcutPath.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-
-        print(f"Created application menu entry: {shortcutPath}")
-        print("You may need to log out and in or refresh your desktop environment.")
+    startMenuDirectory: Path = (Path(appData) / "Microsoft" / "Windows" / "Start Menu" / "Programs")
+    startMenuDirectory.mkdir(parents=True, exist_ok=True)
+
+    shortcutPath: Path = startMenuDirectory / f"{APP_NAME}.lnk"
+    createWindowsShortcutLnk(shortcutPath, mainPyPath, appDirectory, iconPath)
+
+
+def createMacStartMenuEntry(mainPyPath: Path, appDirectory: Path, iconPath: Optional[Path]) -> None:
+    print("macOS does not have a simple Start Menu equivalent. Skipping.")
+
+
+def createLinuxStartMenuEntry(mainPyPath: Path, appDirectory: Path, iconPath: Optional[Path]) -> None:
+    applicationsDirectory: Path = Path.home() / ".local" / "share" / "applications"
+    applicationsDirectory.mkdir(parents=True, exist_ok=True)
+
+    shortcutPath: Path = applicationsDirectory / "random-student-picker.desktop"
+    writeDesktopEntry(shortcutPath, mainPyPath, iconPath)
+
+    print(f"Created application menu entry: {shortcutPath}")
+    print("You may need to log out and in or refresh your desktop environment.")
+
+
+DESKTOP_SHORTCUT_CREATORS: Dict[str, Callable[[Path, Path, Optional[Path]], None]] = {
+    "win": createWindowsDesktopShortcut,
+    "mac": createMacDesktopShortcut,
+    "linux": createLinuxDesktopShortcut,
+}
+
+START_MENU_ENTRY_CREATORS: Dict[str, Callable[[Path, Path, Optional[Path]], None]] = {
+    "win": createWindowsStartMenuEntry,
+    "mac": createMacStartMenuEntry,
+    "linux": createLinuxStartMenuEntry,
+}
+
+
+def createDesktopShortcut(mainPyPath: Path, appDirectory: Path, iconPath: Optional[Path]) -> None:
+    getDesktopDirectory().mkdir(parents=True, exist_ok=True)
+    DESKTOP_SHORTCUT_CREATORS[PLATFORM_NAME](mainPyPath, appDirectory, iconPath)
+
+
+def createStartMenuEntry(mainPyPath: Path, appDirectory: Path, iconPath: Optional[Path]) -> None:
+    START_MENU_ENTRY_CREATORS[PLATFORM_NAME](mainPyPath, appDirectory, iconPath)
 
 
 def main() -> None:
@@ -162,43 +309,57 @@ def main() -> None:
     classesDirectory: Path = baseDirectory / "classes"
 
     assetsDirectory: Path = baseDirectory / "assets" / "sys"
-    assetsDirectory.mkdir(parents=True, exist_ok=True)
 
     mainPyPath: Path = baseDirectory / MAIN_FILE_NAME
     iconPath: Optional[Path] = assetsDirectory / ICON_FILE_NAME
     requirementsPath: Path = baseDirectory / "requirements.txt"
+    windowsShortcutRequirementsPath: Path = baseDirectory / "requirements-windows.txt"
+    pipCacheDirectory: Path = baseDirectory / ".pip-cache"
+
+    forceDownload: bool = "--force" in sys.argv[1:]
 
     print(f"Installing {APP_NAME} to: {baseDirectory}")
 
-    classesDirectory.mkdir(parents=True, exist_ok=True)
+    for directory in (classesDirectory, assetsDirectory, pipCacheDirectory):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    print("\nWriting requirements.txt...")
+    writeFile(requirementsPath, REQUIREMENTS_CONTENT)
+
+    pipProcess: subprocess.Popen = pipInstallRequirements(requirementsPath, pipCacheDirectory)
 
-    print("\nDownloading main.py...")
-    if not downloadFile(RAW_MAIN_URL, mainPyPath):
+    downloadJobs: List[Tuple[str, Path]] = [(RAW_MAIN_URL, mainPyPath), (RAW_ICON_URL, iconPath)]
+
+    print("\nDownloading application files...")
+    downloadResults: Dict[str, bool] = downloadMany(downloadJobs, force=forceDownload)
+
+    if not downloadResults[RAW_MAIN_URL]:
+        pipProcess.wait()
         sys.exit(1)
 
-    print("\nDownloading icon...")
-    if not downloadFile(RAW_ICON_URL, iconPath):
+    if not downloadResults[RAW_ICON_URL]:
         print("Icon download failed; continuing without icon.")
         iconPath = None
 
-    print("\nWriting requirements.txt...")
-    writeFile(requirementsPath, REQUIREMENTS_CONTENT)
-
-    pipInstallRequirements(requirementsPath)
-
     try:
         answerDesktop: str = input("\nCreate a Desktop shortcut? [y/N]: ").strip().lower()
     except EOFError:
         answerDesktop = "n"
 
-    if answerDesktop == "y":
-        createDesktopShortcut(mainPyPath, baseDirectory, iconPath)
-
     try:
         answerMenu: str = input("Create a Start Menu / application menu entry? [y/N]: ").strip().lower()
     except EOFError:
         answerMenu = "n"
 
+    waitForPipInstall(pipProcess, requirementsPath)
+
+    if PLATFORM_NAME == "win" and "y" in (answerDesktop, answerMenu):
+        writeFile(windowsShortcutRequirementsPath, WINDOWS_SHORTCUT_REQUIREMENTS_CONTENT)
+        waitForPipInstall(pipInstallRequirements(windowsShortcutRequirementsPath, pipCacheDirectory), windowsShortcutRequirementsPath)
+
+    if answerDesktop == "y":
+        createDesktopShortcut(mainPyPath, baseDirectory, iconPath)
+
     if answerMenu == "y":
         createStartMenuEntry(mainPyPath, baseDirectory, iconPath)
 
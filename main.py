@@ -1,25 +1,53 @@
 from __future__ import annotations
 
 import csv
+import io
 import json
+import math
+import os
 import random
+import sys
 import traceback
-from dataclasses import dataclass, asdict
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, asdict, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Deque, Dict, List, Optional
 
 import customtkinter as ctk
 from tkinter import messagebox
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+STATS_NAME_WIDTH: int = 20
+STATS_PICKS_WIDTH: int = 7
+STATS_WEIGHT_WIDTH: int = 8
+STATS_HEADER_TEXT: str = f"{'Name':<{STATS_NAME_WIDTH}} {'Picks':>{STATS_PICKS_WIDTH}} {'Weight':>{STATS_WEIGHT_WIDTH}}"
+STATS_SEPARATOR_TEXT: str = "─" * len(STATS_HEADER_TEXT)
+STATS_ROW_FORMAT: Callable[..., str] = f"{{:<{STATS_NAME_WIDTH}}} {{:>{STATS_PICKS_WIDTH}d}} {{:>{STATS_WEIGHT_WIDTH}.2f}}".format
+FILE_READ_BUFFER_SIZE: int = 65536
+JSON_STREAMING_THRESHOLD_BYTES: int = 5_000_000
+DATACLASS_OPTIONS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class Student:
     name: str
     weight: float = 0.5
     count: int = 0
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class AppSettings:
     appearanceMode: str = "dark"
     colorTheme: str = "blue"
@@ -28,6 +56,7 @@ class AppSettings:
     selectedClassFileName: str = ""
 
 
+@lru_cache(maxsize=1)
 def getSettingsFilePath() -> Path:
     homeDirectoryPath: Path = Path.home()
     documentsDirectoryPath: Path = homeDirectoryPath / "Documents"
@@ -37,6 +66,7 @@ def getSettingsFilePath() -> Path:
     return settingsFilePath
 
 
+@lru_cache(maxsize=1)
 def getClassesDirectoryPath() -> Path:
     settingsDirectoryPath: Path = getSettingsFilePath().parent
     classesDirectoryPath: Path = settingsDirectoryPath / "classes"
@@ -44,6 +74,103 @@ def getClassesDirectoryPath() -> Path:
     return classesDirectoryPath
 
 
+def parseJsonBytes(data: bytes):
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def serializeJsonBytes(data) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def serializeStudentListJsonBytes(studentList: List[Student]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(studentList, option=orjson.OPT_INDENT_2)
+    return serializeJsonBytes([{"name": student.name, "weight": student.weight, "count": student.count} for student in studentList])
+
+
+def serializeStudentListCsvBytes(studentList: List[Student]) -> bytes:
+    csvBuffer: io.StringIO = io.StringIO(newline="")
+    writer = csv.writer(csvBuffer)
+    writer.writerow(("name", "weight", "count"))
+    writer.writerows([(student.name, student.weight, student.count) for student in studentList])
+    return csvBuffer.getvalue().encode("utf-8")
+
+
+STUDENT_FILE_SERIALIZERS: Dict[str, Callable[[List[Student]], bytes]] = {
+    "json": serializeStudentListJsonBytes,
+    "csv": serializeStudentListCsvBytes,
+}
+
+
+def convertToFiniteFloat(value, defaultValue: float) -> float:
+    if type(value) is float:
+        return value if math.isfinite(value) else defaultValue
+    if value == "":
+        return defaultValue
+    try:
+        result: float = float(value)
+    except (TypeError, ValueError, OverflowError):
+        return defaultValue
+    return result if math.isfinite(result) else defaultValue
+
+
+def convertToWeight(value, defaultWeight: float = 0.5) -> float:
+    return convertToFiniteFloat(value, defaultWeight)
+
+
+def convertToCount(value, defaultCount: int = 0) -> int:
+    if type(value) is int:
+        return value
+    if value == "":
+        return defaultCount
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        return defaultCount
+
+
+def createCsvRowStudentBuilder(nameIndex: int, weightIndex: int, countIndex: int) -> Callable[[List[str]], Optional[Student]]:
+    def buildStudentFromCsvRow(row: List[str]) -> Optional[Student]:
+        rowLength: int = len(row)
+        if nameIndex >= rowLength:
+            return None
+
+        rawName: str = row[nameIndex]
+        if not rawName or rawName.isspace():
+            return None
+        name: str = sys.intern(rawName.strip())
+
+        weightRaw: str = row[weightIndex] if 0 <= weightIndex < rowLength else ""
+        countRaw: str = row[countIndex] if 0 <= countIndex < rowLength else ""
+
+        return Student(name=name, weight=convertToWeight(weightRaw), count=convertToCount(countRaw))
+
+    return buildStudentFromCsvRow
+
+
+def buildStudentFromJsonItem(item) -> Optional[Student]:
+    if isinstance(item, dict):
+        name: str = str(item.get("name", "")).strip()
+        weightValue = item.get("weight", 0.5)
+        countValue = item.get("count", 0)
+    else:
+        name = str(item).strip()
+        weightValue = 0.5
+        countValue = 0
+
+    if not name:
+        return None
+
+    return Student(name=sys.intern(name), weight=convertToWeight(weightValue), count=convertToCount(countValue))
+
+
 def loadAppSettingsFromDisk() -> AppSettings:
     settingsFilePath: Path = getSettingsFilePath()
 
@@ -51,14 +178,17 @@ def loadAppSettingsFromDisk() -> AppSettings:
         return AppSettings()
 
     try:
-        with settingsFilePath.open("r", encoding="utf-8") as settingsFile:
-            rawData = json.load(settingsFile)
+        rawData = parseJsonBytes(settingsFilePath.read_bytes())
+
+        weightDecreaseAmount: float = convertToFiniteFloat(rawData.get("weightDecreaseAmount", 0.1), 0.1)
+        if weightDecreaseAmount <= 0.0:
+            weightDecreaseAmount = 0.1
 
         return AppSettings(
             appearanceMode=str(rawData.get("appearanceMode", "dark")),
             colorTheme=str(rawData.get("colorTheme", "blue")),
-            weightDecreaseAmount=float(rawData.get("weightDecreaseAmount", 0.1)),
-            spinnerSpeedValue=float(rawData.get("spinnerSpeedValue", 50.0)),
+            weightDecreaseAmount=weightDecreaseAmount,
+            spinnerSpeedValue=convertToFiniteFloat(rawData.get("spinnerSpeedValue", 50.0), 50.0),
             selectedClassFileName=str(rawData.get("selectedClassFileName", "")),
         )
     except Exception as e:
@@ -67,14 +197,19 @@ def loadAppSettingsFromDisk() -> AppSettings:
         return AppSettings()
 
 
-def saveAppSettingsToDisk(appSettings: AppSettings) -> None:
+def saveAppSettingsToDisk(appSettings: AppSettings) -> bool:
     settingsFilePath: Path = getSettingsFilePath()
+    temporaryFilePath: Path = settingsFilePath.with_suffix(".json.tmp")
     try:
-        with settingsFilePath.open("w", encoding="utf-8") as settingsFile:
-            json.dump(asdict(appSettings), settingsFile, indent=4)
+        settingsFilePath.parent.mkdir(parents=True, exist_ok=True)
+        temporaryFilePath.write_bytes(serializeJsonBytes(asdict(appSettings)))
+        os.replace(temporaryFilePath, settingsFilePath)
+        return True
     except Exception as e:
+        temporaryFilePath.unlink(missing_ok=True)
         print("Error saving app settings:", e)
         traceback.print_exc()
+        return False
 
 
 class StudentManager:
@@ -82,42 +217,163 @@ class StudentManager:
         if studentDictionary is None:
             studentDictionary = {}
         self.studentDictionary: Dict[int, Student] = studentDictionary
+        self.studentList: List[Student] = list(studentDictionary.values())
+        self.studentWeightList: List[float] = [student.weight for student in self.studentList]
         self.weightDecreaseAmount: float = 0.1
+        self.randomGenerator: random.Random = random.Random()
+        self.activeStudentCount: int = sum(1 for weight in self.studentWeightList if weight > 0.0)
+
+        self.aliasPositionList: List[int] = []
+        self.aliasProbabilityList: List[float] = []
+        self.aliasIndexList: List[int] = []
+        self.aliasWeightList: List[float] = []
+        self.aliasBuildTotalWeight: float = 0.0
+        self.aliasCurrentTotalWeight: float = 0.0
+        self.aliasWeightUnit: float = 1.0
+        self.aliasRebuildThreshold: float = 0.7
+        self.aliasMaximumRejectionCount: int = 32
+        self.aliasTableDirty: bool = True
+
+        self.studentNameListCache: Optional[List[str]] = None
+        self.summaryLineListCache: Optional[List[str]] = None
+
+    def rebuildAliasTable(self) -> None:
+        positionList: List[int] = []
+        weightList: List[float] = []
+        for position, weight in enumerate(self.studentWeightList):
+            if weight > 0.0:
+                positionList.append(position)
+                weightList.append(weight)
+        keyCount: int = len(positionList)
+
+        probabilityList: List[float] = [1.0] * keyCount
+        aliasIndexList: List[int] = list(range(keyCount))
+        totalWeight: float = sum(weightList)
+        weightUnit: float = 1.0
+
+        if not math.isfinite(totalWeight):
+            if not all(math.isfinite(weight) for weight in weightList):
+                raise ValueError("Student weights must be finite.")
+            weightUnit = max(weightList)
+            totalWeight = sum(weight / weightUnit for weight in weightList)
+
+        if keyCount and min(weightList) != max(weightList):
+            scale: float = keyCount / totalWeight
+            scaledWeightList: List[float] = [weight / weightUnit * scale for weight in weightList]
+
+            smallIndexList: List[int] = []
+            largeIndexList: List[int] = []
+            for index, scaledWeight in enumerate(scaledWeightList):
+                if scaledWeight < 1.0:
+                    smallIndexList.append(index)
+                else:
+                    largeIndexList.append(index)
+
+            while smallIndexList and largeIndexList:
+                smallIndex: int = smallIndexList.pop()
+                largeIndex: int = largeIndexList.pop()
+
+                probabilityList[smallIndex] = scaledWeightList[smallIndex]
+                aliasIndexList[smallIndex] = largeIndex
+
+                scaledWeightList[largeIndex] -= 1.0 - scaledWeightList[smallIndex]
+                if scaledWeightList[largeIndex] < 1.0:
+                    smallIndexList.append(largeIndex)
+                else:
+                    largeIndexList.append(largeIndex)
+
+        self.aliasPositionList = positionList
+        self.aliasProbabilityList = probabilityList
+        self.aliasIndexList = aliasIndexList
+        self.aliasWeightList = weightList
+        self.aliasBuildTotalWeight = totalWeight
+        self.aliasCurrentTotalWeight = totalWeight
+        self.aliasWeightUnit = weightUnit
+        self.aliasTableDirty = False
+
+    def sampleAliasTable(self) -> int:
+        randomFraction: Callable[[], float] = self.randomGenerator.random
+        randomSlotIndex: Callable[[int], int] = self.randomGenerator.randrange
+        slotCount: int = len(self.aliasPositionList)
+        rejectionCount: int = 0
+
+        while True:
+            slotIndex: int = randomSlotIndex(slotCount)
+            if randomFraction() >= self.aliasProbabilityList[slotIndex]:
+                slotIndex = self.aliasIndexList[slotIndex]
+
+            position: int = self.aliasPositionList[slotIndex]
+            if randomFraction() * self.aliasWeightList[slotIndex] < self.studentWeightList[position]:
+                return position
+
+            rejectionCount += 1
+            if rejectionCount >= self.aliasMaximumRejectionCount:
+                self.rebuildAliasTable()
+                slotCount = len(self.aliasPositionList)
+                rejectionCount = 0
 
     def pickRandomStudent(self) -> Optional[Student]:
-        activeStudentList: List[Student] = [student for student in self.studentDictionary.values() if student.weight > 0.0]
-        if not activeStudentList:
+        if self.aliasTableDirty or self.aliasCurrentTotalWeight < self.aliasBuildTotalWeight * self.aliasRebuildThreshold:
+            self.rebuildAliasTable()
+
+        if not self.aliasPositionList:
             return None
 
-        weightList: List[float] = [student.weight for student in activeStudentList]
-        selectedStudent: Student = random.choices(population=activeStudentList, weights=weightList, k=1)[0]
+        position: int = self.sampleAliasTable()
+        selectedStudent: Student = self.studentList[position]
 
+        previousWeight: float = self.studentWeightList[position]
+        newWeight: float = previousWeight - self.weightDecreaseAmount
+        if newWeight < 0.0:
+            newWeight = 0.0
+        self.studentWeightList[position] = newWeight
         selectedStudent.count += 1
-        selectedStudent.weight = max(selectedStudent.weight - self.weightDecreaseAmount, 0.0)
+        selectedStudent.weight = newWeight
+        self.aliasCurrentTotalWeight -= (previousWeight - newWeight) / self.aliasWeightUnit
+        if newWeight > previousWeight:
+            self.aliasTableDirty = True
+        self.summaryLineListCache = None
+
+        if newWeight == 0.0 and previousWeight > 0.0:
+            self.activeStudentCount -= 1
 
         return selectedStudent
 
     def getStudentNameList(self) -> List[str]:
-        return [student.name for student in self.studentDictionary.values()]
+        if self.studentNameListCache is None:
+            self.studentNameListCache = [student.name for student in self.studentList]
+        return self.studentNameListCache
 
     def resetAllStudents(self, defaultWeight: float = 0.5) -> None:
-        for student in self.studentDictionary.values():
+        for student in self.studentList:
             student.count = 0
             student.weight = defaultWeight
+        self.studentWeightList = [defaultWeight] * len(self.studentList)
+        self.activeStudentCount = len(self.studentDictionary) if defaultWeight > 0.0 else 0
+        self.aliasTableDirty = True
+        self.summaryLineListCache = None
 
     def resetAllWeights(self, defaultWeight: float = 0.5) -> None:
-        for student in self.studentDictionary.values():
+        for student in self.studentList:
             student.weight = defaultWeight
+        self.studentWeightList = [defaultWeight] * len(self.studentList)
+        self.activeStudentCount = len(self.studentDictionary) if defaultWeight > 0.0 else 0
+        self.aliasTableDirty = True
+        self.summaryLineListCache = None
 
     def getStudentSummaryLines(self) -> List[str]:
-        summaryLineList: List[str] = []
-        for student in self.studentDictionary.values():
-            summaryLine: str = f"{student.name}: picks={student.count}, weight={student.weight:.2f}"
-            summaryLineList.append(summaryLine)
-        return summaryLineList
+        if self.summaryLineListCache is None:
+            self.summaryLineListCache = [f"{student.name}: picks={student.count}, weight={student.weight:.2f}" for student in self.studentList]
+        return self.summaryLineListCache
 
     def setStudentsFromList(self, studentList: List[Student]) -> None:
         self.studentDictionary = {index: student for index, student in enumerate(studentList)}
+        self.studentList = list(studentList)
+        self.studentWeightList = [student.weight for student in studentList]
+        self.activeStudentCount = sum(1 for weight in self.studentWeightList if weight > 0.0)
+        self.aliasTableDirty = True
+        self.studentNameListCache = None
+        self.summaryLineListCache = None
 
 
 class RandomStudentPickerApp(ctk.CTk):
@@ -125,16 +381,25 @@ class RandomStudentPickerApp(ctk.CTk):
         super().__init__()
 
         self.studentManager: StudentManager = studentManager
+        self.randomGenerator: random.Random = random.Random()
         self.appSettings: AppSettings = loadAppSettingsFromDisk()
+        self.lastSavedAppSettings: AppSettings = replace(self.appSettings)
 
         self.currentStudentFilePath: Optional[Path] = None
-        self.currentStudentFileType: Optional[str] = None
+        self.currentStudentFileSerializer: Optional[Callable[[List[Student]], bytes]] = None
 
         self.classDropdownPlaceholderText: str = "Select class file..."
         self.classFileOptions: Dict[str, Path] = {}
 
         self.resetWeightsButtonVisible: bool = False
 
+        self.pendingSettingsSaveAfterId: Optional[str] = None
+        self.pendingClassFileHighlightResetAfterId: Optional[str] = None
+        self.settingsSaveDelayMilliseconds: int = 300
+
+        self.fileIoExecutor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
+        self.fileIoPollDelayMilliseconds: int = 50
+
         ctk.set_appearance_mode(self.appSettings.appearanceMode)
         ctk.set_default_color_theme(self.appSettings.colorTheme)
 
@@ -158,7 +423,9 @@ class RandomStudentPickerApp(ctk.CTk):
 
         self.updateSpinnerDelaysFromSpeed(self.appSettings.spinnerSpeedValue)
 
-        self.tabView: ctk.CTkTabview = ctk.CTkTabview(self)
+        self.statsTabDirty: bool = True
+
+        self.tabView: ctk.CTkTabview = ctk.CTkTabview(self, command=self.onTabChanged)
         self.tabView.pack(expand=True, fill="both", padx=10, pady=10)
 
         self.tabView.add("Instant")
@@ -208,7 +475,7 @@ class RandomStudentPickerApp(ctk.CTk):
 
         self.instantSelectedStudentLabel.configure(text=f"Selected: {selectedStudent.name}")
 
-        self.refreshStatsTab()
+        self.requestStatsRefresh()
 
         if self.allWeightsZero():
             self.instantPickStudentButton.configure(state="disabled")
@@ -222,11 +489,19 @@ class RandomStudentPickerApp(ctk.CTk):
         self.isSpinning: bool = False
         self.currentSpinFrameIndex: int = 0
         self.totalSpinFrameCount: int = 60
+        self.spinFullCycleCount: int = 20
 
         self.spinNameList: List[str] = []
+        self.spinNameCycle: Deque[str] = deque()
+        self.spinDelayScheduleList: List[int] = []
         self.currentCenterNameIndex: int = 0
         self.selectedStudentForSpin: Optional[Student] = None
 
+        self.slotFont: ctk.CTkFont = ctk.CTkFont(family="Arial", size=18)
+        self.centerSlotFont: ctk.CTkFont = ctk.CTkFont(family="Arial", size=20, weight="bold")
+        self.winnerSlotFont: ctk.CTkFont = ctk.CTkFont(family="Arial", size=22, weight="bold")
+        self.spinnerSlotStylesStale: bool = True
+
         self.slotFrames: List[ctk.CTkFrame] = []
         self.slotLabels: List[ctk.CTkLabel] = []
 
@@ -249,7 +524,7 @@ class RandomStudentPickerApp(ctk.CTk):
             slotFrame: ctk.CTkFrame = ctk.CTkFrame(master=self.spinnerSlotStripFrame, corner_radius=12, border_width=2, border_color="gray50")
             slotFrame.grid(row=0, column=columnIndex, padx=8, pady=8, sticky="nsew")
 
-            slotLabel: ctk.CTkLabel = ctk.CTkLabel(master=slotFrame, text="", font=("Arial", 18), width=120, height=50, anchor="center")
+            slotLabel: ctk.CTkLabel = ctk.CTkLabel(master=slotFrame, text="", font=self.slotFont, width=120, height=50, anchor="center")
             slotLabel.pack(expand=True, fill="both", padx=4, pady=4)
 
             self.slotFrames.append(slotFrame)
@@ -259,14 +534,10 @@ class RandomStudentPickerApp(ctk.CTk):
             self.spinnerSlotStripFrame.grid_columnconfigure(columnIndex, weight=1)
 
     def initializeSpinNameList(self) -> None:
-        studentNameList: List[str] = self.studentManager.getStudentNameList()
-        if not studentNameList:
-            self.spinNameList = []
-        else:
-            repeatCount: int = 10
-            self.spinNameList = studentNameList * repeatCount
+        self.spinNameList = self.studentManager.getStudentNameList()
 
         self.currentCenterNameIndex = 0
+        self.spinNameCycle = deque(self.spinNameList)
 
     def updateSpinnerSlotLabelsFromCenterIndex(self) -> None:
         if not self.spinNameList:
@@ -274,24 +545,20 @@ class RandomStudentPickerApp(ctk.CTk):
                 label.configure(text="No students")
             return
 
-        totalNames: int = len(self.spinNameList)
+        if self.spinnerSlotStylesStale:
+            for slotIndex in range(self.slotCount):
+                if slotIndex == self.centerSlotIndex:
+                    self.slotFrames[slotIndex].configure(border_color="yellow")
+                    self.slotLabels[slotIndex].configure(font=self.centerSlotFont)
+                else:
+                    self.slotFrames[slotIndex].configure(border_color="gray50")
+                    self.slotLabels[slotIndex].configure(font=self.slotFont)
+            self.spinnerSlotStylesStale = False
 
         for slotIndex in range(self.slotCount):
             offsetFromCenter: int = slotIndex - self.centerSlotIndex
-            nameIndex: int = (self.currentCenterNameIndex + offsetFromCenter) % totalNames
-            studentName: str = self.spinNameList[nameIndex]
-
-            label: ctk.CTkLabel = self.slotLabels[slotIndex]
-            frame: ctk.CTkFrame = self.slotFrames[slotIndex]
-
-            if slotIndex == self.centerSlotIndex:
-                frame.configure(border_color="yellow")
-                label.configure(font=("Arial", 20, "bold"))
-            else:
-                frame.configure(border_color="gray50")
-                label.configure(font=("Arial", 18, "normal"))
-
-            label.configure(text=studentName)
+            studentName: str = self.spinNameCycle[offsetFromCenter % len(self.spinNameCycle)]
+            self.slotLabels[slotIndex].configure(text=studentName)
 
     def onSpinnerPickStudentButtonClicked(self) -> None:
         if not self.studentManager.studentDictionary:
@@ -313,7 +580,7 @@ class RandomStudentPickerApp(ctk.CTk):
         self.selectedStudentForSpin = selectedStudent
         self.startSpinnerSpinAnimation()
 
-        self.refreshStatsTab()
+        self.requestStatsRefresh()
 
         if self.allWeightsZero():
             self.spinnerPickStudentButton.configure(state="disabled")
@@ -328,7 +595,7 @@ class RandomStudentPickerApp(ctk.CTk):
         totalNames = len(self.spinNameList)
 
         if totalNames > 0:
-            self.currentCenterNameIndex = random.randint(0, totalNames - 1)
+            self.currentCenterNameIndex = self.randomGenerator.randrange(totalNames)
 
             if self.selectedStudentForSpin is not None:
                 targetName = self.selectedStudentForSpin.name
@@ -339,15 +606,20 @@ class RandomStudentPickerApp(ctk.CTk):
                         return (targetIndex - startIndex) % size
 
                     minForward = min(forwardDistance(idx, self.currentCenterNameIndex, totalNames) for idx in indices)
-                    minFullSpins = 2
-                    self.totalSpinFrameCount = minFullSpins * totalNames + minForward
+                    self.totalSpinFrameCount = self.spinFullCycleCount * totalNames + minForward
                 else:
-                    self.totalSpinFrameCount = totalNames * 2
+                    self.totalSpinFrameCount = totalNames * self.spinFullCycleCount
             else:
-                self.totalSpinFrameCount = totalNames * 2
+                self.totalSpinFrameCount = totalNames * self.spinFullCycleCount
         else:
             self.totalSpinFrameCount = 0
 
+        self.spinNameCycle = deque(self.spinNameList)
+        self.spinNameCycle.rotate(-self.currentCenterNameIndex)
+
+        delayRange: int = self.maximumSpinDelayMilliseconds - self.minimumSpinDelayMilliseconds
+        self.spinDelayScheduleList = [int(self.minimumSpinDelayMilliseconds + delayRange * (frameIndex / self.totalSpinFrameCount) ** 2) for frameIndex in range(self.totalSpinFrameCount)]
+
         self.animateSpinnerSpinFrame()
 
     def animateSpinnerSpinFrame(self) -> None:
@@ -359,12 +631,10 @@ class RandomStudentPickerApp(ctk.CTk):
             self.finishSpinnerSpinAnimation()
             return
 
-        self.currentCenterNameIndex = (self.currentCenterNameIndex + 1) % len(self.spinNameList)
+        self.spinNameCycle.rotate(-1)
         self.updateSpinnerSlotLabelsFromCenterIndex()
 
-        progress: float = self.currentSpinFrameIndex / float(self.totalSpinFrameCount) if self.totalSpinFrameCount > 0 else 1.0
-        delayRange: int = self.maximumSpinDelayMilliseconds - self.minimumSpinDelayMilliseconds
-        currentDelay: int = int(self.minimumSpinDelayMilliseconds + delayRange * (progress ** 2))
+        currentDelay: int = self.spinDelayScheduleList[self.currentSpinFrameIndex]
 
         self.currentSpinFrameIndex += 1
         self.after(currentDelay, self.animateSpinnerSpinFrame)
@@ -375,7 +645,8 @@ class RandomStudentPickerApp(ctk.CTk):
             centerFrame: ctk.CTkFrame = self.slotFrames[self.centerSlotIndex]
 
             centerFrame.configure(border_color="lime")
-            centerLabel.configure(text=self.selectedStudentForSpin.name, font=("Arial", 22, "bold"))
+            centerLabel.configure(text=self.selectedStudentForSpin.name, font=self.winnerSlotFont)
+            self.spinnerSlotStylesStale = True
 
             self.spinnerSelectedStudentLabel.configure(text=f"Selected: {self.selectedStudentForSpin.name}")
 
@@ -397,23 +668,24 @@ class RandomStudentPickerApp(ctk.CTk):
 
         self.refreshStatsTab()
 
+    def onTabChanged(self) -> None:
+        if self.statsTabDirty and self.tabView.get() == "Stats":
+            self.refreshStatsTab()
+
+    def requestStatsRefresh(self) -> None:
+        self.statsTabDirty = True
+        if self.tabView.get() == "Stats":
+            self.refreshStatsTab()
+
     def refreshStatsTab(self) -> None:
+        self.statsTabDirty = False
+
         if not self.studentManager.studentDictionary:
             self.statsLabel.configure(text="No students loaded.\nChoose a class list in the Settings tab.")
             return
 
-        nameWidth: int = 20
-        picksWidth: int = 7
-        weightWidth: int = 8
-
-        header: str = f"{'Name':<{nameWidth}} {'Picks':>{picksWidth}} {'Weight':>{weightWidth}}"
-        separator: str = "─" * len(header)
-
-        lineList: List[str] = [header, separator]
-
-        for student in self.studentManager.studentDictionary.values():
-            line: str = f"{student.name:<{nameWidth}} {student.count:>{picksWidth}d} {student.weight:>{weightWidth}.2f}"
-            lineList.append(line)
+        lineList: List[str] = [STATS_HEADER_TEXT, STATS_SEPARATOR_TEXT]
+        lineList.extend([STATS_ROW_FORMAT(student.name, student.count, student.weight) for student in self.studentManager.studentList])
 
         statsText: str = "\n".join(lineList)
         self.statsLabel.configure(text=statsText)
@@ -434,9 +706,7 @@ class RandomStudentPickerApp(ctk.CTk):
         self.hideResetWeightsButton()
 
     def allWeightsZero(self) -> bool:
-        if not self.studentManager.studentDictionary:
-            return False
-        return all(student.weight <= 0.0 for student in self.studentManager.studentDictionary.values())
+        return bool(self.studentManager.studentDictionary) and self.studentManager.activeStudentCount == 0
 
     def showResetWeightsButton(self) -> None:
         if not self.resetWeightsButtonVisible:
@@ -533,7 +803,21 @@ class RandomStudentPickerApp(ctk.CTk):
         self.studentFileLabel.grid(row=1, column=0, columnspan=3, padx=10, pady=5, sticky="w")
 
     def saveSettings(self) -> None:
-        saveAppSettingsToDisk(self.appSettings)
+        if self.appSettings == self.lastSavedAppSettings:
+            return
+        if saveAppSettingsToDisk(self.appSettings):
+            self.lastSavedAppSettings = replace(self.appSettings)
+
+    def scheduleSettingsSave(self) -> None:
+        if self.pendingSettingsSaveAfterId is not None:
+            self.after_cancel(self.pendingSettingsSaveAfterId)
+        self.pendingSettingsSaveAfterId = self.after(self.settingsSaveDelayMilliseconds, self.flushSettingsSave)
+
+    def flushSettingsSave(self) -> None:
+        if self.pendingSettingsSaveAfterId is not None:
+            self.after_cancel(self.pendingSettingsSaveAfterId)
+            self.pendingSettingsSaveAfterId = None
+        self.saveSettings()
 
     def updateSpinnerDelaysFromSpeed(self, sliderValue: float) -> None:
         time: float = sliderValue / 100.0
@@ -551,13 +835,13 @@ class RandomStudentPickerApp(ctk.CTk):
 
         self.appSettings.appearanceMode = self.currentAppearanceMode
         ctk.set_appearance_mode(self.currentAppearanceMode)
-        self.saveSettings()
+        self.scheduleSettingsSave()
 
     def onThemeChanged(self, value: str) -> None:
         self.currentColorTheme = value
         self.appSettings.colorTheme = value
         ctk.set_default_color_theme(self.currentColorTheme)
-        self.saveSettings()
+        self.scheduleSettingsSave()
 
     def onWeightDecreaseApplyClicked(self) -> None:
         try:
@@ -567,7 +851,7 @@ class RandomStudentPickerApp(ctk.CTk):
 
             self.studentManager.weightDecreaseAmount = value
             self.appSettings.weightDecreaseAmount = value
-            self.saveSettings()
+            self.scheduleSettingsSave()
         except ValueError:
             messagebox.showerror("Invalid value", "Weight decrease must be a positive number.", parent=self)
             self.weightDecreaseEntry.delete(0, "end")
@@ -578,11 +862,14 @@ class RandomStudentPickerApp(ctk.CTk):
         self.spinnerSpeedValueLabel.configure(text=f"{sliderValue:.0f}")
         self.appSettings.spinnerSpeedValue = sliderValue
         self.updateSpinnerDelaysFromSpeed(sliderValue)
-        self.saveSettings()
+        self.scheduleSettingsSave()
 
     def refreshClassFileList(self) -> None:
         classesDirectoryPath: Path = getClassesDirectoryPath()
-        allFiles: List[Path] = sorted(path for path in classesDirectoryPath.iterdir() if path.is_file() and path.suffix.lower() in (".json", ".csv"))
+        classesDirectoryPath.mkdir(parents=True, exist_ok=True)
+        with os.scandir(classesDirectoryPath) as directoryEntries:
+            classFileEntries: List[os.DirEntry] = [entry for entry in directoryEntries if entry.name.lower().endswith((".json", ".csv")) and entry.is_file()]
+        allFiles: List[Path] = sorted(Path(entry.path) for entry in classFileEntries)
 
         self.classFileOptions = {filePath.name: filePath for filePath in allFiles}
 
@@ -593,7 +880,7 @@ class RandomStudentPickerApp(ctk.CTk):
             self.studentFileLabel.configure(text=("No class files found.\n" "Add .json or .csv files to:\n" f"{classesDirectoryPath}"))
 
             self.currentStudentFilePath = None
-            self.currentStudentFileType = None
+            self.currentStudentFileSerializer = None
             return
 
         values = [self.classDropdownPlaceholderText] + [filePath.name for filePath in allFiles]
@@ -620,20 +907,36 @@ class RandomStudentPickerApp(ctk.CTk):
         filePath: Path = self.classFileOptions[value]
         extension: str = filePath.suffix.lower()
 
+        if extension == ".json":
+            studentLoader: Callable[[Path], List[Student]] = self.loadStudentsFromJsonFile
+            fileType: str = "json"
+        elif extension == ".csv":
+            studentLoader = self.loadStudentsFromCsvFile
+            fileType = "csv"
+        else:
+            messagebox.showerror("Unsupported file type", "Please use a .json or .csv file.", parent=self)
+            return
+
+        self.classFileOptionMenu.configure(state="disabled")
+        loadFuture: Future = self.fileIoExecutor.submit(studentLoader, filePath)
+        self.after(self.fileIoPollDelayMilliseconds, self.pollStudentFileLoad, loadFuture, filePath, fileType)
+
+    def pollStudentFileLoad(self, loadFuture: Future, filePath: Path, fileType: str) -> None:
+        if not loadFuture.done():
+            self.after(self.fileIoPollDelayMilliseconds, self.pollStudentFileLoad, loadFuture, filePath, fileType)
+            return
+
+        self.classFileOptionMenu.configure(state="normal")
+
         try:
-            if extension == ".json":
-                studentList: List[Student] = self.loadStudentsFromJsonFile(filePath)
-                self.currentStudentFileType = "json"
-            elif extension == ".csv":
-                studentList = self.loadStudentsFromCsvFile(filePath)
-                self.currentStudentFileType = "csv"
-            else:
-                messagebox.showerror("Unsupported file type", "Please use a .json or .csv file.", parent=self)
-                return
+            studentList: List[Student] = loadFuture.result()
         except Exception as error:
             messagebox.showerror("Error loading students", f"Could not load students:\n{error}", parent=self)
             return
 
+        self.onStudentsLoaded(studentList, filePath, fileType)
+
+    def onStudentsLoaded(self, studentList: List[Student], filePath: Path, fileType: str) -> None:
         self.studentManager.setStudentsFromList(studentList)
 
         self.initializeSpinNameList()
@@ -644,8 +947,9 @@ class RandomStudentPickerApp(ctk.CTk):
         self.spinnerSelectedStudentLabel.configure(text="No student selected yet.")
 
         self.currentStudentFilePath = filePath
+        self.currentStudentFileSerializer = STUDENT_FILE_SERIALIZERS[fileType]
         self.appSettings.selectedClassFileName = filePath.name
-        self.saveSettings()
+        self.scheduleSettingsSave()
 
         self.studentFileLabel.configure(text=f"Loaded: {filePath.name}")
 
@@ -678,75 +982,59 @@ class RandomStudentPickerApp(ctk.CTk):
     def highlightClassFileFrame(self) -> None:
         try:
             self.classFileFrame.configure(border_color="orange", border_width=3)
-            self.after(1000, lambda: self.classFileFrame.configure(border_color="gray30", border_width=1))
+            if self.pendingClassFileHighlightResetAfterId is not None:
+                self.after_cancel(self.pendingClassFileHighlightResetAfterId)
+            self.pendingClassFileHighlightResetAfterId = self.after(1000, self.resetClassFileFrameHighlight)
         except Exception:
             pass
 
-    def loadStudentsFromJsonFile(self, filePath: Path) -> List[Student]:
-        with filePath.open("r", encoding="utf-8") as jsonFile:
-            rawData = json.load(jsonFile)
-
-        studentList: List[Student] = []
+    def resetClassFileFrameHighlight(self) -> None:
+        self.pendingClassFileHighlightResetAfterId = None
+        self.classFileFrame.configure(border_color="gray30", border_width=1)
 
-        if isinstance(rawData, dict):
-            iterable = rawData.values()
+    def loadStudentsFromJsonFile(self, filePath: Path) -> List[Student]:
+        if ijson is not None and filePath.stat().st_size > JSON_STREAMING_THRESHOLD_BYTES:
+            studentList: List[Student] = self.streamStudentsFromJsonFile(filePath)
         else:
-            iterable = rawData
+            rawData = parseJsonBytes(filePath.read_bytes())
 
-        for item in iterable:
-            if isinstance(item, dict):
-                name: str = str(item.get("name", "")).strip()
-                weightValue = item.get("weight", 0.5)
-                countValue = item.get("count", 0)
+            if isinstance(rawData, dict):
+                iterable = rawData.values()
             else:
-                name = str(item).strip()
-                weightValue = 0.5
-                countValue = 0
-
-            if not name:
-                continue
-
-            try:
-                weight = float(weightValue)
-            except (TypeError, ValueError):
-                weight = 0.5
+                iterable = rawData
 
-            try:
-                count = int(countValue)
-            except (TypeError, ValueError):
-                count = 0
-
-            studentList.append(Student(name=name, weight=weight, count=count))
+            studentList = [student for student in map(buildStudentFromJsonItem, iterable) if student is not None]
 
         if not studentList:
             raise ValueError("No valid students found in JSON file. Each item should have at least a 'name'.")
 
         return studentList
 
-    def loadStudentsFromCsvFile(self, filePath: Path) -> List[Student]:
-        studentList: List[Student] = []
+    def streamStudentsFromJsonFile(self, filePath: Path) -> List[Student]:
+        with filePath.open("rb", buffering=FILE_READ_BUFFER_SIZE) as jsonFile:
+            firstCharacter: bytes = jsonFile.read(FILE_READ_BUFFER_SIZE).lstrip()[:1]
+            jsonFile.seek(0)
 
-        with filePath.open("r", encoding="utf-8", newline="") as csvFile:
-            csvReader = csv.DictReader(csvFile)
-            for row in csvReader:
-                name: str = str(row.get("name", "")).strip()
-                if not name:
-                    continue
+            if firstCharacter == b"{":
+                itemIterator = (value for _, value in ijson.kvitems(jsonFile, "", use_float=True))
+            else:
+                itemIterator = ijson.items(jsonFile, "item", use_float=True)
 
-                weightRaw = row.get("weight", "")
-                countRaw = row.get("count", "")
+            return [student for student in map(buildStudentFromJsonItem, itemIterator) if student is not None]
 
-                try:
-                    weight = float(weightRaw) if weightRaw != "" else 0.5
-                except ValueError:
-                    weight = 0.5
+    def loadStudentsFromCsvFile(self, filePath: Path) -> List[Student]:
+        studentList: List[Student] = []
 
-                try:
-                    count = int(countRaw) if countRaw != "" else 0
-                except ValueError:
-                    count = 0
+        with filePath.open("r", encoding="utf-8", newline="", buffering=FILE_READ_BUFFER_SIZE) as csvFile:
+            csvReader = csv.reader(csvFile)
+            headerRow: List[str] = next(csvReader, [])
+            nameIndex: int = headerRow.index("name") if "name" in headerRow else -1
+            weightIndex: int = headerRow.index("weight") if "weight" in headerRow else -1
+            countIndex: int = headerRow.index("count") if "count" in headerRow else -1
 
-                studentList.append(Student(name=name, weight=weight, count=count))
+            if nameIndex >= 0:
+                buildStudentFromCsvRow = createCsvRowStudentBuilder(nameIndex, weightIndex, countIndex)
+                studentList = [student for student in map(buildStudentFromCsvRow, csvReader) if student is not None]
 
         if not studentList:
             raise ValueError("No valid students found in CSV file. Make sure it has a 'name' column and optionally 'weight' and 'count' columns.")
@@ -754,22 +1042,16 @@ class RandomStudentPickerApp(ctk.CTk):
         return studentList
 
     def saveStudentsToFile(self) -> None:
-        if self.currentStudentFilePath is None or self.currentStudentFileType is None:
+        if self.currentStudentFilePath is None or self.currentStudentFileSerializer is None:
             return
 
-        studentList: List[Student] = list(self.studentManager.studentDictionary.values())
-
-        if self.currentStudentFileType == "json":
-            data = [{"name": student.name, "weight": student.weight, "count": student.count} for student in studentList]
-            with self.currentStudentFilePath.open("w", encoding="utf-8") as jsonFile:
-                json.dump(data, jsonFile, indent=4)
-        elif self.currentStudentFileType == "csv":
-            with self.currentStudentFilePath.open("w", encoding="utf-8", newline="") as csvFile:
-                fieldnames = ["name", "weight", "count"]
-                writer = csv.DictWriter(csvFile, fieldnames=fieldnames)
-                writer.writeheader()
-                for student in studentList:
-                    writer.writerow({"name": student.name, "weight": student.weight, "count": student.count})
+        temporaryFilePath: Path = self.currentStudentFilePath.with_suffix(self.currentStudentFilePath.suffix + ".tmp")
+        try:
+            temporaryFilePath.write_bytes(self.currentStudentFileSerializer(self.studentManager.studentList))
+            os.replace(temporaryFilePath, self.currentStudentFilePath)
+        except Exception:
+            temporaryFilePath.unlink(missing_ok=True)
+            raise
 
     def onWindowClosing(self) -> None:
         if self.currentStudentFilePath is not None:
@@ -779,12 +1061,14 @@ class RandomStudentPickerApp(ctk.CTk):
                 return
             if result is True:
                 try:
-                    self.saveStudentsToFile()
+                    saveFuture: Future = self.fileIoExecutor.submit(self.saveStudentsToFile)
+                    saveFuture.result()
                 except Exception as error:
                     messagebox.showerror("Error saving students", f"Could not save students:\n{error}", parent=self)
                     return
 
-        self.saveSettings()
+        self.flushSettingsSave()
+        self.fileIoExecutor.shutdown(wait=False)
         self.destroy()
 
 